@@ -1,9 +1,11 @@
+import asyncio
 import aiohttp
 from .command import *
 from .embed import Embed
 from .file import File
 from fastapi import FastAPI
-from functools import wraps
+from nacl.signing import VerifyKey
+from types import MappingProxyType
 from .handler import handler
 from .https import HTTPClient
 from .enums import ApplicationCommandType
@@ -16,7 +18,7 @@ from .dash import dashboard
 from .params import handle_send_params, merge_fields
 from fastapi.responses import JSONResponse
 from .multipart import create_form
-from typing import Optional, List, Dict, Union, Callable
+from typing import Optional, List, Dict, Tuple, Union, Callable
 from .webhook import Webhook
 
 
@@ -66,12 +68,19 @@ class Client(FastAPI):
         self.docs_url = None
         self.redoc_url = None
         self.public_key = public_key
+        self._verify_key = VerifyKey(bytes.fromhex(public_key))
         self.application_id = application_id  # type: ignore
         self.http = HTTPClient(token, self, aiohttp.ClientSession("https://discord.com"))
         self.active_components: Optional[Dict[str, Component]] = {}
         self._sync_queue: List[ApplicationCommand] = []
-        self.application_commands: Dict[str, ApplicationCommand] = {}
+        self._commands: Dict[str, ApplicationCommand] = {}
+        # read-only live view of self._commands, consumed by the interaction handler
+        self.application_commands = MappingProxyType(self._commands)
+        self._sub_dispatch: Dict[Tuple[str, str], SubCommand] = {}
         self.cached_inter_tokens: Dict[str, str] = {}
+        self.cached_dm_channel_ids: Dict[str, str] = {}
+        self.guild_cache_ttl: float = 60.0
+        self._guild_cache: Dict[Tuple[str, str], Tuple[float, list]] = {}
         self.add_route(route, handler, methods=["POST"], include_in_schema=False)
         self.add_api_route("/api/sync/{token}", sync, methods=["GET"], include_in_schema=False)
         self.add_api_route("/api/dash/{token}", dashboard, methods=["GET"], include_in_schema=False)
@@ -79,6 +88,7 @@ class Client(FastAPI):
             "/api/commands/{command_id}/{token}", delete_cmd, methods=["DELETE"], include_in_schema=False)
         self.error_handler: Optional[Callable] = None
         self._custom_id_parser: Optional[Callable] = None
+        self.router.on_shutdown.append(self.http.session.close)
 
     def load_components(self, view: View):
         """
@@ -144,14 +154,12 @@ class Client(FastAPI):
         )
 
         def decorator(coro: Callable):
-            @wraps(coro)
-            def wrapper(*_, **__):
-                if asyncio.iscoroutinefunction(coro):
-                    cmd.callback = coro
-                    self.application_commands[cmd._id] = cmd  # noqa
-                    self._sync_queue.append(cmd)
-                    return cmd
-            return wrapper()
+            if not asyncio.iscoroutinefunction(coro):
+                raise TypeError(f"command `{name}` callback must be a coroutine function")
+            cmd.callback = coro
+            self._commands[cmd._id] = cmd  # noqa
+            self._sync_queue.append(cmd)
+            return cmd
 
         return decorator
 
@@ -164,7 +172,7 @@ class Client(FastAPI):
         *commands: ApplicationCommand
             The commands to add to the client.
         """
-        self.application_commands.update({command._id: command for command in commands})  # noqa
+        self._commands.update({command._id: command for command in commands})  # noqa
         self._sync_queue.extend(commands)
 
     async def delete_command(self, command_id: str):
@@ -256,7 +264,13 @@ class Client(FastAPI):
         """
         resp = await self.http.sync_commands(
             str(self.application_id), [command.to_dict() for command in self._sync_queue])
-        return await resp.json()
+        payload = await resp.json()
+        if isinstance(payload, list):
+            for entry in payload:
+                command = self._commands.get(f"{entry['name']}:{entry['type']}")
+                if command:
+                    self._commands[entry["id"]] = command
+        return payload
 
     async def create_webhook(self, channel_id: str, *, name: str, image_base64: Optional[str] = None):
         """
@@ -1,3 +1,6 @@
+import time
+from functools import partial, reduce
+from operator import or_
 from .role import Role
 from .channel import Channel
 from .enums import ChannelType
@@ -8,39 +11,96 @@ from typing import Dict, Any, TYPE_CHECKING, List, Optional
 if TYPE_CHECKING:
     from .client import Client
 
+# Guild fields documented as Optional; Discord routinely omits them, so
+# lazy attribute access falls back to None instead of raising.
+_OPTIONAL_GUILD_FIELDS = frozenset(
+    (
+        "icon",
+        "icon_hash",
+        "splash",
+        "discovery_splash",
+        "owner",
+        "permissions",
+        "afk_channel_id",
+        "widget_enabled",
+        "widget_channel_id",
+        "application_id",
+        "system_channel_id",
+        "rules_channel_id",
+        "max_presences",
+        "max_members",
+        "vanity_url_code",
+        "description",
+        "banner",
+        "premium_subscription_count",
+        "public_updates_channel_id",
+        "max_video_channel_users",
+        "approximate_member_count",
+        "approximate_presence_count",
+        "welcome_screen",
+        "stickers",
+    )
+)
+
 
 class PartialGuild:
     """
     Represents a partial guild.
     """
 
+    __slots__ = ("id", "client")
+
     def __init__(self, guild_id: str, client: "Client"):
         self.id = guild_id
         self.client = client
 
-    async def fetch_channels(self) -> List[Channel]:
+    async def fetch_channels(self, *, force: bool = False) -> List[Channel]:
         """
         Fetches all channels in the guild.
 
+        Results are cached for ``client.guild_cache_ttl`` seconds.
+
+        Parameters
+        ----------
+        force: bool
+            Whether to skip the cache and hit the API. Defaults to False.
+
         Returns
         -------
         List[Channel]
         """
+        cached = None if force else self.client._guild_cache.get((self.id, "channels"))
+        if cached and time.monotonic() - cached[0] < self.client.guild_cache_ttl:
+            return cached[1]
         resp = await self.client.http.fetch_guild_channels(self.id)
         data = await resp.json()
-        return [Channel(c, self.client) for c in data]
+        channels = list(map(partial(Channel, client=self.client), data))
+        self.client._guild_cache[(self.id, "channels")] = (time.monotonic(), channels)
+        return channels
 
-    async def fetch_roles(self) -> List[Role]:
+    async def fetch_roles(self, *, force: bool = False) -> List[Role]:
         """
         Fetches all roles in the guild.
 
+        Results are cached for ``client.guild_cache_ttl`` seconds.
+
+        Parameters
+        ----------
+        force: bool
+            Whether to skip the cache and hit the API. Defaults to False.
+
         Returns
         -------
         List[Role]
         """
+        cached = None if force else self.client._guild_cache.get((self.id, "roles"))
+        if cached and time.monotonic() - cached[0] < self.client.guild_cache_ttl:
+            return cached[1]
         resp = await self.client.http.fetch_guild_roles(self.id)
         data = await resp.json()
-        return [Role(r, self.client) for r in data]
+        roles = list(map(partial(Role, client=self.client), data))
+        self.client._guild_cache[(self.id, "roles")] = (time.monotonic(), roles)
+        return roles
 
     async def create_channel(
         self,
@@ -106,35 +166,23 @@ class PartialGuild:
         -------
         :class:`Channel`
         """
-        payload = {"name": name, "type": type.value}
-        if topic:
-            payload["topic"] = topic
-        if bitrate:
-            payload["bitrate"] = bitrate
-        if user_limit:
-            payload["user_limit"] = user_limit
-        if rate_limit_per_user:
-            payload["rate_limit_per_user"] = rate_limit_per_user
-        if position:
-            payload["position"] = position
-        if permission_overwrites:
-            payload["permission_overwrites"] = permission_overwrites
-        if parent_id:
-            payload["parent_id"] = parent_id
-        if nsfw:
-            payload["nsfw"] = nsfw
-        if rtc_region:
-            payload["rtc_region"] = rtc_region
-        if video_quality_mode:
-            payload["video_quality_mode"] = video_quality_mode
-        if default_auto_archive_duration:
-            payload["default_auto_archive_duration"] = default_auto_archive_duration
-        if default_reaction_emoji:
-            payload["default_reaction_emoji"] = default_reaction_emoji
-        if available_tags:
-            payload["available_tags"] = available_tags
-        if default_sort_order:
-            payload["default_sort_order"] = default_sort_order
+        optional = {
+            "topic": topic,
+            "bitrate": bitrate,
+            "user_limit": user_limit,
+            "rate_limit_per_user": rate_limit_per_user,
+            "position": position,
+            "permission_overwrites": permission_overwrites,
+            "parent_id": parent_id,
+            "nsfw": nsfw,
+            "rtc_region": rtc_region,
+            "video_quality_mode": video_quality_mode,
+            "default_auto_archive_duration": default_auto_archive_duration,
+            "default_reaction_emoji": default_reaction_emoji,
+            "available_tags": available_tags,
+            "default_sort_order": default_sort_order,
+        }
+        payload = {"name": name, "type": type.value, **{k: v for k, v in optional.items() if v is not None}}
         resp = await self.client.http.create_guild_channel(self.id, payload)
         data = await resp.json()
         return Channel(data, self.client)
@@ -178,22 +226,19 @@ class PartialGuild:
             unicode_emoji: str = None,
 
     ):
-        payload = {"name": name}
-        base_permissions = 0
-        if permissions:
-            for permission in permissions:
-                base_permissions |= permission.value
-        payload["permissions"] = base_permissions
-        if color:
-            payload["color"] = color
-        if hoist:
-            payload["hoist"] = hoist
-        if mentionable:
-            payload["mentionable"] = mentionable
-        if icon_data_uri:
-            payload["icon"] = icon_data_uri
-        if unicode_emoji:
-            payload["unicode_emoji"] = unicode_emoji
+        base_permissions = reduce(or_, (permission.value for permission in permissions or ()), 0)
+        optional = {
+            "color": color,
+            "hoist": hoist,
+            "mentionable": mentionable,
+            "icon": icon_data_uri,
+            "unicode_emoji": unicode_emoji,
+        }
+        payload = {
+            "name": name,
+            "permissions": base_permissions,
+            **{k: v for k, v in optional.items() if v is not None},
+        }
         resp = await self.client.http.create_guild_role(self.id, payload)
         data = await resp.json()
         return Role(data, self.client)
@@ -287,44 +332,19 @@ class Guild(PartialGuild):
         Whether the premium progress bar is enabled.
     """
 
+    __slots__ = ("_data",)
+
     def __init__(self, data: Dict[str, Any], client: "Client"):
         super().__init__(data["id"], client)
-        self.name = data["name"]
-        self.icon = data.get("icon")
-        self.icon_hash = data.get("icon_hash")
-        self.splash = data.get("splash")
-        self.discovery_splash = data.get("discovery_splash")
-        self.owner = data.get("owner")
-        self.owner_id = data["owner_id"]
-        self.permissions = data.get("permissions")
-        self.afk_channel_id = data.get("afk_channel_id")
-        self.afk_timeout = data["afk_timeout"]
-        self.widget_enabled = data.get("widget_enabled")
-        self.widget_channel_id = data.get("widget_channel_id")
-        self.verification_level = data["verification_level"]
-        self.default_message_notifications = data["default_message_notifications"]
-        self.explicit_content_filter = data["explicit_content_filter"]
-        self.roles = data["roles"]
-        self.emojis = data["emojis"]
-        self.features = data["features"]
-        self.mfa_level = data["mfa_level"]
-        self.application_id = data.get("application_id")
-        self.system_channel_id = data.get("system_channel_id")
-        self.system_channel_flags = data["system_channel_flags"]
-        self.rules_channel_id = data.get("rules_channel_id")
-        self.max_presences = data.get("max_presences")
-        self.max_members = data.get("max_members")
-        self.vanity_url_code = data.get("vanity_url_code")
-        self.description = data.get("description")
-        self.banner = data.get("banner")
-        self.premium_tier = data["premium_tier"]
-        self.premium_subscription_count = data.get("premium_subscription_count")
-        self.preferred_locale = data["preferred_locale"]
-        self.public_updates_channel_id = data.get("public_updates_channel_id")
-        self.max_video_channel_users = data.get("max_video_channel_users")
-        self.approximate_member_count = data.get("approximate_member_count")
-        self.approximate_presence_count = data.get("approximate_presence_count")
-        self.welcome_screen = data.get("welcome_screen")
-        self.nsfw_level = data["nsfw_level"]
-        self.stickers = data.get("stickers")
-        self.premium_progress_bar_enabled = data["premium_progress_bar_enabled"]
+        self._data = data
+
+    def __getattr__(self, name: str):
+        if name == "_data":
+            # the slot is unset (e.g. mid copy/unpickle); recursing would never end
+            raise AttributeError(name)
+        if name in _OPTIONAL_GUILD_FIELDS:
+            return self._data.get(name)
+        try:
+            return self._data[name]
+        except KeyError:
+            raise AttributeError(name) from None
@@ -1,3 +1,4 @@
+import json
 import traceback
 from .command import *
 from fastapi import Request
@@ -13,10 +14,109 @@ from .enums import (
     MessageComponentType,
     InteractionCallbackType,
 )
-from nacl.signing import VerifyKey
 from nacl.exceptions import BadSignatureError
 from .interaction import Interaction, ComponentInteraction
 from fastapi.responses import JSONResponse, Response
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import Client
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+
+_PING = InteractionType.ping.value
+_APP_COMMAND = InteractionType.app_command.value
+_COMPONENT = InteractionType.component.value
+_MODAL_SUBMIT = InteractionType.modal_submit.value
+_AUTOCOMPLETE = InteractionType.autocomplete.value
+_PONG = InteractionCallbackType.pong.value
+_SLASH_COMMAND = ApplicationCommandType.slash.value
+_SUBCOMMAND = ApplicationCommandOptionType.subcommand.value
+_BUTTON = MessageComponentType.button.value
+
+# serialized once at import; Response instances are stateless and safe to reuse
+_PONG_RESPONSE = Response(content=json.dumps({"type": _PONG}), media_type="application/json")
+
+_SELECT_MENU_TYPES = frozenset(
+    (
+        MessageComponentType.text_select_menu.value,
+        MessageComponentType.user_select_menu.value,
+        MessageComponentType.role_select_menu.value,
+        MessageComponentType.mentionable_select_menu.value,
+        MessageComponentType.channel_select_menu.value,
+    )
+)
+
+
+async def _handle_app_command(app: "Client", interaction: Interaction):
+    data = interaction.data
+    key = f"{data['name']}:{data['type']}"
+    command: ApplicationCommand = app.application_commands.get(key)
+    if not command:
+        raise RuntimeError(f"command `{data['name']}` ({data['id']}) not found")
+
+    if not (data["type"] == _SLASH_COMMAND):
+        target_object = build_context_menu_param(interaction)
+        await command.__call__(interaction, target_object)
+
+    elif data.get("options") and (
+        data["options"][0].get("type") == _SUBCOMMAND
+    ):
+        subcommand_name = data["options"][0]["name"]
+        subcommand = app._sub_dispatch.get((key, subcommand_name))
+        if subcommand is None:
+            subcommand = command.subcommands.get(subcommand_name)
+            app._sub_dispatch[(key, subcommand_name)] = subcommand
+        args, kwargs = build_slash_command_prams(subcommand, interaction)
+        await subcommand.__call__(interaction, *args, **kwargs)
+    else:
+        args, kwargs = build_slash_command_prams(command.callback, interaction)
+        await command.__call__(interaction, *args, **kwargs)
+
+
+async def _handle_component(app: "Client", interaction: ComponentInteraction):
+    custom_id = interaction.data["custom_id"]
+    if app._custom_id_parser:
+        custom_id = await app._custom_id_parser(custom_id)
+    component = app.active_components.get(custom_id, None)
+    if not component:
+        return JSONResponse({"error": "component not found"}, status_code=404)
+    component_type = interaction.data["component_type"]
+    if component_type == _BUTTON:
+        await component.__call__(interaction)
+    elif component_type in _SELECT_MENU_TYPES:
+        await component.__call__(interaction, build_select_menu_values(interaction))
+
+
+async def _handle_modal(app: "Client", interaction: Interaction):
+    component = app.active_components.get(interaction.data["custom_id"], None)
+    if not component:
+        return JSONResponse({"error": "component not found!"}, status_code=404)
+    args, kwargs = build_modal_params(component.callback, interaction)
+    await component.__call__(interaction, *args, **kwargs)
+
+
+async def _handle_autocomplete(app: "Client", interaction: Interaction):
+    data = interaction.data
+    command: ApplicationCommand = app.application_commands.get(data["id"])
+    if not command:
+        return JSONResponse({"error": "command not found"}, status_code=404)
+    option_name = data["options"][0]["name"]
+    option_value = data["options"][0]["value"]
+    if option_value:
+        await command.autocomplete_callback(interaction, option_name, option_value)
+
+
+_DISPATCH = {
+    _APP_COMMAND: _handle_app_command,
+    _COMPONENT: _handle_component,
+    _MODAL_SUBMIT: _handle_modal,
+    _AUTOCOMPLETE: _handle_autocomplete,
+}
 
 
 # noinspection PyProtectedMember
@@ -28,81 +128,36 @@ async def handler(request: Request):
     """
     signature = request.headers.get("X-Signature-Ed25519")
     timestamp = request.headers.get("X-Signature-Timestamp")
+    if not signature or not timestamp:
+        return Response(content="BadSignature", status_code=401)
+    app = request.app
+    body = await request.body()
     try:
-        key = VerifyKey(bytes.fromhex(request.app.public_key))
-        key.verify(str(timestamp).encode() + await request.body(), bytes.fromhex(str(signature)))
-    except BadSignatureError:
+        ts = timestamp.encode("ascii")
+        message = bytearray(len(ts) + len(body))
+        message[:len(ts)] = ts
+        message[len(ts):] = body
+        app._verify_key.verify(message, bytes.fromhex(signature))
+    except (BadSignatureError, ValueError):
         return Response(content="BadSignature", status_code=401)
 
-    data = await request.json()
-    interaction = Interaction(data, request.app)
+    data = _loads(body)
+    if data["type"] == _PING:
+        return _PONG_RESPONSE
+    dispatch = _DISPATCH.get(data["type"])
+    if not dispatch:
+        return JSONResponse({"message": "unhandled interaction type"}, status_code=300)
+    if data["type"] == _COMPONENT:
+        interaction = ComponentInteraction(data, app)
+    else:
+        interaction = Interaction(data, app)
     try:
-        if data["type"] == InteractionType.ping.value:
-            return JSONResponse({"type": InteractionCallbackType.pong.value}, status_code=200)
-
-        elif data["type"] == InteractionType.app_command.value:
-            key = f"{interaction.data['name']}:{interaction.data['type']}"
-            command: ApplicationCommand = request.app.application_commands.get(key)
-            if not command:
-                raise RuntimeError(f"command `{interaction.data['name']}` ({interaction.data['id']}) not found")
-
-            elif not (interaction.data["type"] == ApplicationCommandType.slash.value):
-                target_object = build_context_menu_param(interaction)
-                await command.__call__(interaction, target_object)
-
-            elif interaction.data.get("options") and (
-                interaction.data["options"][0].get("type") == ApplicationCommandOptionType.subcommand.value
-            ):
-                subcommand = command.subcommands.get(interaction.data["options"][0]["name"])
-                args, kwargs = build_slash_command_prams(subcommand, interaction)
-                await subcommand.__call__(interaction, *args, **kwargs)
-            else:
-                args, kwargs = build_slash_command_prams(command.callback, interaction)
-                await command.__call__(interaction, *args, **kwargs)
-
-        elif data["type"] == InteractionType.component.value:
-            interaction = ComponentInteraction(data, request.app)
-            custom_id = interaction.data["custom_id"]
-            if request.app._custom_id_parser:
-                custom_id = await request.app._custom_id_parser(custom_id)
-            component = request.app.active_components.get(custom_id, None)
-            if not component:
-                return JSONResponse({"error": "component not found"}, status_code=404)
-            if interaction.data["component_type"] == MessageComponentType.button.value:
-                await component.__call__(interaction)
-            menu_types = [
-                MessageComponentType.text_select_menu.value,
-                MessageComponentType.user_select_menu.value,
-                MessageComponentType.role_select_menu.value,
-                MessageComponentType.mentionable_select_menu.value,
-                MessageComponentType.channel_select_menu.value,
-            ]
-            if interaction.data["component_type"] in menu_types:
-                await component.__call__(interaction, build_select_menu_values(interaction))
-
-        elif data["type"] == InteractionType.modal_submit.value:
-            component = request.app.active_components.get(interaction.data["custom_id"], None)
-            if not component:
-                return JSONResponse({"error": "component not found!"}, status_code=404)
-            args, kwargs = build_modal_params(component.callback, interaction)
-            await component.__call__(interaction, *args, **kwargs)
-
-        elif data["type"] == InteractionType.autocomplete.value:
-            interaction = Interaction(data, request.app)
-            command: ApplicationCommand = request.app.application_commands.get(interaction.data["id"])
-            if not command:
-                return JSONResponse({"error": "command not found"}, status_code=404)
-            option_name = interaction.data["options"][0]["name"]
-            option_value = interaction.data["options"][0]["value"]
-            if option_value:
-                await command.autocomplete_callback(interaction, option_name, option_value)
-        else:
-            return JSONResponse({"message": "unhandled interaction type"}, status_code=300)
+        response = await dispatch(app, interaction)
     except Exception as e:
-        if request.app.error_handler:
-            await request.app.error_handler(interaction, e)
+        if app.error_handler:
+            await app.error_handler(interaction, e)
         else:
             err = ''.join(traceback.format_exception(type(e), e, e.__traceback__))
             raise RuntimeError(err) from None
     else:
-        return JSONResponse({"ack": 1}, status_code=200)
+        return response if response is not None else JSONResponse({"ack": 1}, status_code=200)
@@ -11,6 +11,7 @@ class HTTPClient:
         self.token = token
         self.client = client
         self.session = session
+        self._auth_header = f"Bot {token}"
     
     async def request(
             self, 
@@ -22,7 +23,7 @@ class HTTPClient:
     ):
         headers = kwargs.pop("headers", {})
         if use_auth:
-            headers["Authorization"] = f"Bot {self.token}"
+            headers["Authorization"] = self._auth_header
         headers["Content-Type"] = "application/json"
         kwargs["headers"] = headers
         return await self.session.request(method, f"/api/v10{path}", **kwargs)
@@ -35,7 +36,7 @@ class HTTPClient:
         use_auth: bool = False
     ):
         if use_auth:
-            form.headers.add("Authorization", f"Bot {self.token}")
+            form.headers.add("Authorization", self._auth_header)
         return await self.session.request(method, f"/api/v10{path}", data=form, headers=form.headers)
 
     async def sync_commands(self, application_id: str, commands: List[Dict[str, Any]]):
@@ -3,12 +3,17 @@ import aiohttp
 from .file import File
 from typing import Dict, Any, List, Optional
 
+try:
+    from orjson import dumps as _dumps
+except ImportError:
+    _dumps = json.dumps
+
 
 # noinspection PyTypeChecker
 def create_form(payload: Dict[str, Any], files: Optional[List[File]] = None) -> aiohttp.MultipartWriter:
     form = aiohttp.MultipartWriter("form-data")
     form.append(
-        json.dumps(payload), 
+        _dumps(payload),
         headers={
             "Content-Disposition": 'form-data; name="payload_json"',
             "Content-Type": "application/json"
@@ -1,19 +1,54 @@
+from operator import attrgetter
 from .file import File
 from .view import View
 from .embed import Embed
-from typing import Optional, List, Any
+from typing import Optional, List, Dict, Any, Sequence
 
+_attachment_attrs = attrgetter("name", "spoiler", "description")
 
-MISSING = Any
+# shared "reset" value for edit payloads; only ever read by the JSON encoder
+_EMPTY: List[Any] = []
 
+# message flags indexed by (ephemeral << 1) | suppress_embeds
+_FLAG_TABLE = (0, 1 << 2, 1 << 6, (1 << 6) | (1 << 2))
 
-def merge_fields(field: Optional[Any], fields: Optional[List[Any]]) -> List[Any]:
-    tmp = []
-    if field and field is not MISSING:
-        tmp.append(field)
-    if fields and fields is not MISSING:
-        tmp.extend(fields)
-    return tmp
+
+class _MissingSentinel:
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return "..."
+
+
+MISSING: Any = _MissingSentinel()
+
+
+def merge_fields(field: Optional[Any], fields: Optional[List[Any]]) -> Sequence[Any]:
+    # the result may alias `fields`; callers must treat it as read-only
+    has_field = field is not None and field is not MISSING
+    has_fields = fields is not None and fields is not MISSING
+    if has_field and has_fields:
+        return [field, *fields]
+    if has_fields:
+        return fields
+    if has_field:
+        return (field,)
+    return ()
+
+
+def _embeds_payload(embeds: List[Embed]) -> List[Dict[str, Any]]:
+    return list(map(Embed.to_dict, embeds))
+
+
+def _attachments_payload(files: List[File]) -> List[Dict[str, Any]]:
+    out: List[Dict[str, Any]] = [None] * len(files)  # type: ignore
+    for i, file in enumerate(files):
+        name, spoiler, description = _attachment_attrs(file)
+        out[i] = {"id": i, "filename": name, "ephemeral": spoiler, "description": description}
+    return out
 
 
 def handle_send_params(
@@ -29,31 +64,19 @@ def handle_send_params(
     suppress_embeds: Optional[bool] = False,
 ):
     payload = {}
-    flag_value = 0
     embeds = merge_fields(embed, embeds)
     files = merge_fields(file, files)
-    if ephemeral:
-        flag_value |= 1 << 6
-    if suppress_embeds:
-        flag_value |= 1 << 2
+    flag_value = _FLAG_TABLE[(bool(ephemeral) << 1) | bool(suppress_embeds)]
     if content:
         payload["content"] = str(content)
     if tts:
         payload["tts"] = True
     if embeds:
-        payload["embeds"] = [embed.to_dict() for embed in embeds]
+        payload["embeds"] = _embeds_payload(embeds)
     if view:
         payload["components"] = view.components
     if files:
-        payload["attachments"] = [
-            {
-                "id": i,
-                "filename": file.name,
-                "ephemeral": file.spoiler,
-                "description": file.description,
-            }
-            for i, file in enumerate(files)
-        ]
+        payload["attachments"] = _attachments_payload(files)
     if flag_value:
         payload["flags"] = flag_value
     return payload
@@ -72,15 +95,15 @@ def handle_edit_params(
 ):
     payload = {}
     if embed is None:
-        payload["embeds"] = []
+        payload["embeds"] = _EMPTY
     if embeds is None:
-        payload["embeds"] = []
+        payload["embeds"] = _EMPTY
     if view is None:
-        payload["components"] = []
+        payload["components"] = _EMPTY
     if file is None:
-        payload["attachments"] = []
+        payload["attachments"] = _EMPTY
     if files is None:
-        payload["attachments"] = []
+        payload["attachments"] = _EMPTY
     embeds = merge_fields(embed, embeds)
     files = merge_fields(file, files)
     if content is not MISSING:
@@ -88,19 +111,11 @@ def handle_edit_params(
     if tts is not MISSING:
         payload["tts"] = tts
     if embeds:
-        payload["embeds"] = [embed.to_dict() for embed in embeds]
+        payload["embeds"] = _embeds_payload(embeds)
     if view is not MISSING:
-        payload["components"] = view.components if view else []
+        payload["components"] = view.components if view else _EMPTY
     if files:
-        payload["attachments"] = [
-            {
-                "id": i,
-                "filename": file.name,
-                "ephemeral": file.spoiler,
-                "description": file.description,
-            }
-            for i, file in enumerate(files)
-        ]
+        payload["attachments"] = _attachments_payload(files)
     if suppress_embeds is not MISSING:
         payload["flags"] = 1 << 2
 
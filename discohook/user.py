@@ -1,3 +1,4 @@
+from functools import cached_property
 from .asset import Asset
 from .file import File
 from typing import Optional
@@ -10,6 +11,8 @@ from typing import TYPE_CHECKING, Dict, Any, List
 if TYPE_CHECKING:
     from .client import Client
 
+_DEFAULT_AVATARS = ("0", "1", "2", "3", "4")
+
 
 class User:
     """
@@ -47,26 +50,22 @@ class User:
     def __init__(self, data: Dict[str, Any], client: "Client"):
         self.data = data
         self.client = client
+        self.id: str = data["id"]
 
-    @property
-    def id(self) -> str:
-        return self.data["id"]
-
-    @property
+    @cached_property
     def name(self) -> str:
         return self.data["username"]
 
-    @property
+    @cached_property
     def discriminator(self) -> str:
         return self.data["discriminator"]
 
-    @property
+    @cached_property
     def avatar(self) -> Asset:
         av_hash = self.data.get("avatar")
         if not av_hash:
-            fragment = f"embed/avatars/"
-            av_hash = str({int(self.discriminator) % 5})
-            return Asset(hash=av_hash, fragment=fragment)
+            av_hash = _DEFAULT_AVATARS[int(self.discriminator) % 5]
+            return Asset(hash=av_hash, fragment="embed/avatars/")
         return Asset(hash=av_hash, fragment=f"avatars/{self.id}")
 
     @property
@@ -105,9 +104,12 @@ class User:
         return f"{self.name}#{self.discriminator}"
 
     def __eq__(self, other):
-        return self.id == other.id
+        return isinstance(other, User) and self.id == other.id
 
-    @property
+    def __hash__(self):
+        return hash(self.id)
+
+    @cached_property
     def mention(self) -> str:
         return f"<@{self.id}>"
 
@@ -139,18 +141,21 @@ class User:
         files: Optional[:class:`List`[:class:`File`]`]
             The files to be sent with the message.
         """
+        merged_files = merge_fields(file, files)
         payload = handle_send_params(
             content=content,
             tts=tts,
             embed=embed,
             embeds=embeds,
-            file=file,
-            files=files,
+            files=merged_files,
         )
-        resp = await self.client.http.create_dm_channel({"recipient_id": self.id})
-        data = await resp.json()
-        channel_id = data["id"]
-        resp = await self.client.http.send_message(channel_id, create_form(payload, merge_fields(file, files)))
+        channel_id = self.client.cached_dm_channel_ids.get(self.id)
+        if channel_id is None:
+            resp = await self.client.http.create_dm_channel({"recipient_id": self.id})
+            data = await resp.json()
+            channel_id = data["id"]
+            self.client.cached_dm_channel_ids[self.id] = channel_id
+        resp = await self.client.http.send_message(channel_id, create_form(payload, merged_files))
         return await resp.json()
 
 
@@ -184,20 +189,15 @@ class ClientUser:
     def __init__(self, data: Dict[str, Any], client: "Client") -> None:
         self.data = data
         self.client = client
-
-    @property
-    def id(self) -> str:
-        return self.data["id"]
-
-    @property
-    def name(self) -> str:
-        return self.data["name"]
+        self.id: str = data["id"]
+        self.name: str = data["name"]
+        self._permissions_value = int(data.get("install_params", {}).get("permissions", 0))
 
     @property
     def icon_hash(self) -> Optional[str]:
         return self.data.get("icon")
 
-    @property
+    @cached_property
     def icon_url(self) -> Optional[str]:
         return f"https://cdn.discordapp.com/app-icons/{self.id}/{self.icon_hash}.png"
 
@@ -234,4 +234,4 @@ class ClientUser:
         permission: :class:`Permissions`
             The permission to check.
         """
-        return permission.value & int(self.permissions) == permission.value
+        return permission.value & self._permissions_value == permission.value